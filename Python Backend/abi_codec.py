@@ -0,0 +1,87 @@
+from eth_abi import decode as abi_decode, encode as abi_encode
+from eth_utils import function_abi_to_4byte_selector, to_checksum_address
+from eth_utils.abi import collapse_if_tuple
+from typing import Dict, Any, List, Optional, Tuple
+
+# (selector, inputs, input_types, outputs, output_types) for one read function
+ReadCodec = Tuple[bytes, List[Dict[str, Any]], List[str], List[Dict[str, Any]], List[str]]
+
+def build_read_codecs(contract_abi: List[Dict[str, Any]]) -> Dict[str, ReadCodec]:
+    """Precompute selectors and ABI types for every codec-friendly view/pure function
+    
+    Overloaded functions and functions with unnamed inputs are skipped, since
+    their query-string parameters cannot be mapped unambiguously.
+    """
+    function_abis = [abi for abi in contract_abi if abi.get('type') == 'function']
+    names = [abi['name'] for abi in function_abis]
+    return {
+        abi['name']: (
+            function_abi_to_4byte_selector(abi),
+            abi['inputs'],
+            [collapse_if_tuple(i) for i in abi['inputs']],
+            abi['outputs'],
+            [collapse_if_tuple(o) for o in abi['outputs']]
+        )
+        for abi in function_abis
+        if abi.get('stateMutability') in ('view', 'pure')
+        and names.count(abi['name']) == 1
+        and all(i.get('name') for i in abi['inputs'])
+    }
+
+def encode_call_data(codec: ReadCodec, params: Optional[Dict[str, Any]]) -> bytes:
+    """Encode calldata for a read function using its precomputed codec"""
+    selector, inputs, input_types, _, _ = codec
+    params = params or {}
+    
+    names = [i['name'] for i in inputs]
+    missing = [name for name in names if name not in params]
+    if missing:
+        raise Exception(f"Missing parameters: {', '.join(missing)}")
+    
+    unexpected = [name for name in params if name not in names]
+    if unexpected:
+        raise Exception(f"Unexpected parameters: {', '.join(unexpected)}")
+    
+    args = [coerce_arg(t, params[name]) for name, t in zip(names, input_types)]
+    return selector + abi_encode(input_types, args)
+
+def decode_return_data(codec: ReadCodec, data: bytes) -> Any:
+    """Decode a function's ABI-encoded return data the way web3's contract call would"""
+    _, _, _, outputs, output_types = codec
+    values = abi_decode(output_types, data)
+    values = [normalize_output(o, v) for o, v in zip(outputs, values)]
+    return values[0] if len(values) == 1 else values
+
+def normalize_output(output_abi: Dict[str, Any], value) -> Any:
+    """Checksum decoded addresses, including inside arrays and structs"""
+    abi_type = output_abi['type']
+    if abi_type.endswith(']'):
+        item_abi = {**output_abi, 'type': abi_type[:abi_type.rindex('[')]}
+        return [normalize_output(item_abi, item) for item in value]
+    if abi_type == 'address':
+        return to_checksum_address(value)
+    if abi_type == 'tuple':
+        return tuple(
+            normalize_output(c, item) for c, item in zip(output_abi['components'], value)
+        )
+    return value
+
+def coerce_arg(abi_type: str, value) -> Any:
+    """Convert query-string values to the Python type the ABI encoder expects"""
+    if not isinstance(value, str) or abi_type.endswith(']') or abi_type.startswith('('):
+        return value
+    if abi_type.startswith(('uint', 'int')):
+        # Only an explicit 0x prefix means hex; "010" is decimal ten
+        if value.lower().startswith(('0x', '-0x')):
+            return int(value, 16)
+        return int(value)
+    if abi_type == 'bool':
+        lowered = value.lower()
+        if lowered in ('true', '1'):
+            return True
+        if lowered in ('false', '0'):
+            return False
+        raise ValueError(f"Invalid boolean value: {value}")
+    if abi_type.startswith('bytes'):
+        return bytes.fromhex(value[2:] if value.startswith('0x') else value)
+    return value
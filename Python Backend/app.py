@@ -1,8 +1,15 @@
-from flask import Flask, render_template, request, jsonify
+import os
+
+# Under gevent, patch the stdlib before requests/web3 create any sockets or threads
+if os.environ.get('GEVENT_PATCH', 'False').lower() in ['true', '1', 'on']:
+    from gevent import monkey
+    monkey.patch_all()
+
+from flask import Flask, Response, render_template, request
 from flask_cors import CORS
 import json
-import os
-from contract_handler import ContractHandler
+import orjson
+from contract_handler import ContractHandler, FunctionNotFoundError
 from config import Config
 
 app = Flask(__name__)
@@ -12,10 +19,35 @@ app.config.from_object(Config)
 # Initialize contract handler
 contract_handler = ContractHandler()
 
+def _json_default(obj):
+    """Serialize types orjson does not handle natively"""
+    if isinstance(obj, bytes):
+        return obj.hex()
+    if hasattr(obj, 'keys'):
+        return dict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def ojsonify(obj):
+    """Build a JSON response using orjson instead of the stdlib encoder"""
+    return app.response_class(
+        orjson.dumps(obj, default=_json_default, option=orjson.OPT_NON_STR_KEYS),
+        mimetype='application/json'
+    )
+
+# Rendered index page; the template takes no request context, so render it once
+_index_html = None
+
 @app.route('/')
 def index():
     """Main page with contract interaction UI"""
-    return render_template('index.html')
+    global _index_html
+    if _index_html is None:
+        _index_html = render_template('index.html')
+    return Response(
+        _index_html,
+        mimetype='text/html',
+        headers={'Cache-Control': 'public, max-age=60'}
+    )
 
 @app.route('/api/connect', methods=['POST'])
 def connect_wallet():
@@ -23,16 +55,18 @@ def connect_wallet():
     try:
         account_address = request.json.get('account_address')
         if account_address:
-            # Store or validate the account address
-            return jsonify({
+            if not contract_handler.is_valid_address(account_address):
+                return ojsonify({'success': False, 'message': 'Invalid account address'})
+            
+            return ojsonify({
                 'success': True, 
                 'message': 'Wallet connected successfully',
                 'account': account_address
             })
         else:
-            return jsonify({'success': False, 'message': 'No account address provided'})
+            return ojsonify({'success': False, 'message': 'No account address provided'})
     except Exception as e:
-        return jsonify({'success': False, 'message': str(e)})
+        return ojsonify({'success': False, 'message': str(e)})
 
 @app.route('/api/contract/read/<function_name>', methods=['GET'])
 def read_contract(function_name):
@@ -41,9 +75,24 @@ def read_contract(function_name):
         # Get any parameters from query string
         params = dict(request.args)
         result = contract_handler.call_read_function(function_name, params)
-        return jsonify({'success': True, 'result': result})
+        return ojsonify({'success': True, 'result': result})
+    except FunctionNotFoundError as e:
+        return ojsonify({'success': False, 'message': str(e)}), 404
     except Exception as e:
-        return jsonify({'success': False, 'message': str(e)})
+        return ojsonify({'success': False, 'message': str(e)})
+
+@app.route('/api/contract/read_batch', methods=['POST'])
+def read_contract_batch():
+    """Read several contract functions against the same block in one request"""
+    try:
+        calls = request.json.get('calls', [])
+        if not isinstance(calls, list):
+            return ojsonify({'success': False, 'message': 'calls must be a list'})
+        
+        results = contract_handler.call_read_functions_batch(calls)
+        return ojsonify({'success': True, 'results': results})
+    except Exception as e:
+        return ojsonify({'success': False, 'message': str(e)})
 
 @app.route('/api/contract/write/<function_name>', methods=['POST'])
 def write_contract(function_name):
@@ -54,7 +103,10 @@ def write_contract(function_name):
         params = data.get('params', {})
         
         if not account_address:
-            return jsonify({'success': False, 'message': 'Account address required'})
+            return ojsonify({'success': False, 'message': 'Account address required'})
+        
+        if not contract_handler.is_valid_address(account_address):
+            return ojsonify({'success': False, 'message': 'Invalid account address'})
         
         tx_hash = contract_handler.call_write_function(
             function_name, 
@@ -62,51 +114,75 @@ def write_contract(function_name):
             account_address
         )
         
-        return jsonify({
+        if app.config['PRIVATE_KEY']:
+            # Signed server-side and broadcast in the background
+            return ojsonify({
+                'success': True,
+                'tx_hash': tx_hash,
+                'message': 'Transaction submitted'
+            }), 202
+        
+        return ojsonify({
             'success': True, 
             'tx_hash': tx_hash,
             'message': 'Transaction sent successfully'
         })
+    except FunctionNotFoundError as e:
+        return ojsonify({'success': False, 'message': str(e)}), 404
     except Exception as e:
-        return jsonify({'success': False, 'message': str(e)})
+        return ojsonify({'success': False, 'message': str(e)})
 
 @app.route('/api/transaction/<tx_hash>', methods=['GET'])
 def get_transaction_status(tx_hash):
     """Get transaction status"""
     try:
         status = contract_handler.get_transaction_status(tx_hash)
-        return jsonify({'success': True, 'status': status})
+        return ojsonify({'success': True, 'status': status})
     except Exception as e:
-        return jsonify({'success': False, 'message': str(e)})
+        return ojsonify({'success': False, 'message': str(e)})
 
 @app.route('/api/contract/events', methods=['GET'])
 def get_contract_events():
-    """Get recent contract events"""
+    """Stream recent contract events as NDJSON, one event per line"""
     try:
         from_block = request.args.get('from_block', 'latest')
-        events = contract_handler.get_contract_events(from_block)
-        return jsonify({'success': True, 'events': events})
+        events = contract_handler.iter_contract_events(from_block)
     except Exception as e:
-        return jsonify({'success': False, 'message': str(e)})
+        return ojsonify({'success': False, 'message': str(e)})
+    
+    def generate():
+        try:
+            for event in events:
+                yield orjson.dumps(event, default=_json_default) + b'\n'
+        except Exception as e:
+            # The 200 status is already sent, so report the failure as a final line
+            yield orjson.dumps({'error': str(e)}) + b'\n'
+    
+    return Response(generate(), mimetype='application/x-ndjson')
 
 @app.route('/api/network', methods=['GET'])
 def get_network_info():
     """Get current network information"""
     try:
         network_info = contract_handler.get_network_info()
-        return jsonify({'success': True, 'network': network_info})
+        return ojsonify({'success': True, 'network': network_info})
     except Exception as e:
-        return jsonify({'success': False, 'message': str(e)})
+        return ojsonify({'success': False, 'message': str(e)})
 
 @app.errorhandler(404)
 def not_found(error):
-    return jsonify({'success': False, 'message': 'Endpoint not found'}), 404
+    return ojsonify({'success': False, 'message': 'Endpoint not found'}), 404
 
 @app.errorhandler(500)
 def internal_error(error):
-    return jsonify({'success': False, 'message': 'Internal server error'}), 500
+    return ojsonify({'success': False, 'message': 'Internal server error'}), 500
 
 if __name__ == '__main__':
+    # Werkzeug's dev server handles one request at a time; outside development
+    # run under gunicorn instead: gunicorn -c gunicorn.conf.py app:app
+    if not app.config['DEBUG'] and os.environ.get('FLASK_DEV_SERVER', 'False').lower() not in ['true', '1', 'on']:
+        raise SystemExit("Use 'gunicorn -c gunicorn.conf.py app:app', or set FLASK_DEV_SERVER=true")
+    
     app.run(
         debug=app.config['DEBUG'],
         host=app.config['HOST'],
@@ -15,11 +15,14 @@ class Config:
     
     # Blockchain configuration
     BLOCKCHAIN_NETWORK = os.environ.get('BLOCKCHAIN_NETWORK', 'sepolia')  # mainnet, sepolia, polygon, etc.
-    RPC_URL = os.environ.get('RPC_URL', 'https://sepolia.infura.io/v3/YOUR_INFURA_KEY')
+    RPC_URL = os.environ.get('RPC_URL', 'https://sepolia.infura.io/v3/YOUR_INFURA_KEY')  # http(s)://, ws(s):// or ipc:///path/to/node.ipc
+    HEAD_BLOCK_TTL = float(os.environ.get('HEAD_BLOCK_TTL', 1))  # seconds a cached head block is reused
     
     # Contract configuration
     CONTRACT_ADDRESS = os.environ.get('CONTRACT_ADDRESS', '')
     CONTRACT_ABI_PATH = os.environ.get('CONTRACT_ABI_PATH', 'contracts/abi.json')
+    EVENT_BUFFER_SIZE = int(os.environ.get('EVENT_BUFFER_SIZE', 1000))  # recent events kept in memory
+    MULTICALL3_ADDRESS = os.environ.get('MULTICALL3_ADDRESS', '0xcA11bde05977b3631167028862bE2a173976CA11')  # canonical deployment
     
     # Private key for backend transactions (optional, for server-side transactions)
     PRIVATE_KEY = os.environ.get('PRIVATE_KEY', '')
@@ -70,7 +73,6 @@ config = {
     'testing': TestingConfig,
     'default': DevelopmentConfig
 }
-
 # Frontend styling configuration (CSS classes and themes)
 class UIConfig:
     """UI configuration and styling constants"""
@@ -1,23 +1,182 @@
-from web3 import Web3
+from web3 import Web3, AsyncWeb3, WebsocketProviderV2
 from web3.middleware import geth_poa_middleware
+from eth_abi import decode as abi_decode, encode as abi_encode
+from eth_utils import event_abi_to_log_topic, function_abi_to_4byte_selector, to_checksum_address
+from hexbytes import HexBytes
+from cachetools import TTLCache
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+import asyncio
+import functools
 import json
+import atexit
 import os
 import logging
-from typing import Dict, Any, List, Optional
+import logging.handlers
+import queue
+import re
+import threading
+import time
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Dict, Any, Iterator, List, Optional, Tuple
 from config import Config
+from abi_codec import build_read_codecs, encode_call_data, decode_return_data
+
+def _configure_logging():
+    """Send log records through a queue so request threads never block on handler I/O"""
+    root = logging.getLogger()
+    if any(isinstance(h, logging.handlers.QueueHandler) for h in root.handlers):
+        return
+    
+    log_queue = queue.Queue(-1)
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter(logging.BASIC_FORMAT))
+    listener = logging.handlers.QueueListener(
+        log_queue, stream_handler, respect_handler_level=True
+    )
+    listener.start()
+    atexit.register(listener.stop)
+    
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    root.setLevel(logging.INFO)
 
 # Set up logging
-logging.basicConfig(level=logging.INFO)
+_configure_logging()
 logger = logging.getLogger(__name__)
+logger.setLevel(Config.LOG_LEVEL.upper())
+
+# Background workers that broadcast signed transactions off the request path
+_submit_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix='tx-submit')
+
+# Syntactic shape of a 0x-prefixed 20-byte hex address
+_ADDRESS_RE = re.compile(r'0x[0-9a-fA-F]{40}')
+
+# Multicall3 aggregate3(Call3[] calls) -> Result[] returnData; only this entry point is used
+MULTICALL3_AGGREGATE3_ABI = {
+    'type': 'function',
+    'name': 'aggregate3',
+    'stateMutability': 'payable',
+    'inputs': [{
+        'name': 'calls',
+        'type': 'tuple[]',
+        'components': [
+            {'name': 'target', 'type': 'address'},
+            {'name': 'allowFailure', 'type': 'bool'},
+            {'name': 'callData', 'type': 'bytes'}
+        ]
+    }],
+    'outputs': [{
+        'name': 'returnData',
+        'type': 'tuple[]',
+        'components': [
+            {'name': 'success', 'type': 'bool'},
+            {'name': 'returnData', 'type': 'bytes'}
+        ]
+    }]
+}
+MULTICALL3_AGGREGATE3_SELECTOR = function_abi_to_4byte_selector(MULTICALL3_AGGREGATE3_ABI)
+
+# Recent blocks re-fetched on every events refresh so reorged logs get replaced
+REORG_TAIL_BLOCKS = 5
+
+# A cached head older than this many TTLs is treated as unknown
+HEAD_BLOCK_MAX_AGE_TTLS = 3
+
+# Largest integer a JavaScript client can represent exactly
+MAX_SAFE_INTEGER = 2 ** 53 - 1
+
+@functools.lru_cache(maxsize=None)
+def _load_abi(path: str) -> List[Dict[str, Any]]:
+    """Parse a contract ABI file once per process"""
+    with open(path, 'r') as f:
+        return json.load(f)
+
+@functools.lru_cache(maxsize=None)
+def _build_contract(web3: Web3, address: str, abi_path: str):
+    """Create a contract instance once per (provider, address, ABI)"""
+    return web3.eth.contract(address=address, abi=_load_abi(abi_path))
+
+def _build_session() -> requests.Session:
+    """Create an HTTP session with a connection pool sized for concurrent RPC calls"""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=32,
+        pool_maxsize=64,
+        max_retries=Retry(total=3, backoff_factor=0.1)
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+# Preload the configured ABI so the first request does not pay the parse cost
+if os.path.exists(Config.CONTRACT_ABI_PATH):
+    _load_abi(Config.CONTRACT_ABI_PATH)
+
+class FunctionNotFoundError(Exception):
+    """Raised when a requested function is not declared in the contract ABI"""
 
 class ContractHandler:
-    """Handle smart contract interactions using Web3.py"""
+    """Handle smart contract interactions using Web3.py
+    
+    Only one handler (and therefore one provider per RPC URL) exists per
+    process, so every RPC call reuses the same pooled TCP/TLS connections.
+    """
+    
+    _instance = None
+    _instance_lock = threading.Lock()
+    
+    def __new__(cls):
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = super().__new__(cls)
+                cls._instance._initialized = False
+        return cls._instance
     
     def __init__(self):
+        with self._instance_lock:
+            if self._initialized:
+                return
+            self._initialize()
+            self._initialized = True
+    
+    def _initialize(self):
+        """Set up connection and contract state for the process-wide handler"""
         self.config = Config()
+        self.session = _build_session()
+        
+        # Pure functions of config, computed once
+        self._contract_address = (
+            Web3.to_checksum_address(self.config.CONTRACT_ADDRESS)
+            if self.config.CONTRACT_ADDRESS else None
+        )
+        self._max_gas_price_wei = Web3.to_wei(self.config.MAX_GAS_PRICE, 'gwei')
+        self._multicall3_address = Web3.to_checksum_address(self.config.MULTICALL3_ADDRESS)
         self.web3 = None
         self.contract = None
         self.contract_abi = None
+        self._event_decoders = {}
+        self._fn_cache = {}
+        self._read_codecs = {}
+        self._events_cache = TTLCache(maxsize=64, ttl=3)
+        self._recent_events = deque(maxlen=self.config.EVENT_BUFFER_SIZE)
+        self._last_seen_block = None
+        self._events_lock = threading.Lock()
+        self._log_subscription_active = False
+        self._read_cache = TTLCache(maxsize=1024, ttl=2)
+        self._read_cache_lock = threading.Lock()
+        self._cached_block_number = None
+        self._head_lock = threading.Lock()
+        self._head_checked_at = float('-inf')
+        self._head_refreshed_at = float('-inf')
+        self._chain_id = None
+        self._nonces = {}
+        self._nonces_in_flight = {}
+        self._nonce_resync = set()
+        self._nonce_lock = threading.Lock()
+        self._submissions = TTLCache(maxsize=1024, ttl=600)
+        self._submissions_lock = threading.Lock()
         self.initialize_web3()
         self.load_contract()
     
@@ -25,7 +184,19 @@ class ContractHandler:
         """Initialize Web3 connection"""
         try:
             # Connect to blockchain network
-            self.web3 = Web3(Web3.HTTPProvider(self.config.RPC_URL))
+            rpc_url = self.config.RPC_URL
+            if rpc_url.startswith('ipc://'):
+                # Unix socket to a co-located node: no HTTP overhead per call
+                self.web3 = Web3(Web3.IPCProvider(rpc_url[len('ipc://'):]))
+            elif rpc_url.startswith(('ws://', 'wss://')):
+                # Persistent socket; also enables log subscriptions
+                self.web3 = Web3(Web3.WebsocketProvider(rpc_url))
+            else:
+                self.web3 = Web3(Web3.HTTPProvider(
+                    rpc_url,
+                    session=self.session,
+                    request_kwargs={'timeout': 10}
+                ))
             
             # Add PoA middleware for networks like Polygon
             if self.config.BLOCKCHAIN_NETWORK in ['polygon', 'mumbai', 'bsc']:
@@ -33,13 +204,13 @@ class ContractHandler:
             
             # Check connection
             if self.web3.is_connected():
-                logger.info(f"Connected to {self.config.BLOCKCHAIN_NETWORK} network")
-                logger.info(f"Latest block: {self.web3.eth.block_number}")
+                logger.info("Connected to %s network", self.config.BLOCKCHAIN_NETWORK)
+                logger.info("Latest block: %s", self._head_block())
             else:
                 logger.error("Failed to connect to blockchain network")
                 
         except Exception as e:
-            logger.error(f"Web3 initialization error: {str(e)}")
+            logger.error("Web3 initialization error: %s", e)
             raise
     
     def load_contract(self):
@@ -49,44 +220,208 @@ class ContractHandler:
                 logger.warning("No contract address provided")
                 return
             
-            # Load contract ABI
+            # Load contract ABI (parsed once per process)
             if os.path.exists(self.config.CONTRACT_ABI_PATH):
-                with open(self.config.CONTRACT_ABI_PATH, 'r') as f:
-                    self.contract_abi = json.load(f)
+                self.contract_abi = _load_abi(self.config.CONTRACT_ABI_PATH)
             else:
-                logger.error(f"Contract ABI file not found: {self.config.CONTRACT_ABI_PATH}")
+                logger.error("Contract ABI file not found: %s", self.config.CONTRACT_ABI_PATH)
                 return
             
-            # Create contract instance
-            self.contract = self.web3.eth.contract(
-                address=Web3.to_checksum_address(self.config.CONTRACT_ADDRESS),
-                abi=self.contract_abi
+            # Create contract instance (shared across handlers on the same provider)
+            self.contract = _build_contract(
+                self.web3, self._contract_address, self.config.CONTRACT_ABI_PATH
             )
+            
+            # Resolve function proxies once instead of on every call
+            function_names = {abi['name'] for abi in self.contract_abi if abi.get('type') == 'function'}
+            self._fn_cache = {
+                name: getattr(self.contract.functions, name) for name in function_names
+            }
+            
+            # Precompute selectors and ABI types for view/pure functions so reads
+            # can be encoded and decoded without web3's per-call ABI lookup
+            self._read_codecs = build_read_codecs(self.contract_abi)
+            
+            # Map each declared event's topic to its decoder once
+            self._event_decoders = {
+                event_abi_to_log_topic(abi): getattr(self.contract.events, abi['name'])()
+                for abi in self.contract_abi
+                if abi.get('type') == 'event' and not abi.get('anonymous')
+            }
+            
+            # Over WebSocket, let the node push new logs instead of polling per request
+            if self.config.RPC_URL.startswith(('ws://', 'wss://')):
+                threading.Thread(
+                    target=asyncio.run, args=(self._subscribe_logs(),),
+                    name='log-subscriber', daemon=True
+                ).start()
             logger.info("Contract loaded successfully")
             
         except Exception as e:
-            logger.error(f"Contract loading error: {str(e)}")
+            logger.error("Contract loading error: %s", e)
             raise
     
+    def _head_block(self) -> Optional[int]:
+        """Return the head block, refreshing it at most once per HEAD_BLOCK_TTL
+        
+        Returns None when the last successful refresh is too old, so callers
+        fall back to 'latest' and skip the block-keyed caches.
+        """
+        ttl = self.config.HEAD_BLOCK_TTL
+        if time.monotonic() - self._head_checked_at >= ttl and self._head_lock.acquire(blocking=False):
+            # Concurrent requests keep using the previous head while one refreshes it
+            try:
+                self._head_checked_at = time.monotonic()
+                self._cached_block_number = self.web3.eth.block_number
+                self._head_refreshed_at = time.monotonic()
+            except Exception as e:
+                logger.warning("Block number refresh failed: %s", e)
+            finally:
+                self._head_lock.release()
+        
+        if time.monotonic() - self._head_refreshed_at > ttl * HEAD_BLOCK_MAX_AGE_TTLS:
+            return None
+        return self._cached_block_number
+    
+    def _get_function(self, function_name: str):
+        """Look up a cached contract function proxy by name"""
+        try:
+            return self._fn_cache[function_name]
+        except KeyError:
+            raise FunctionNotFoundError(f"Function '{function_name}' not found in contract") from None
+    
+    def _read_cache_key(self, function_name: str, params: Optional[Dict[str, Any]],
+                        block_number: Optional[int]) -> Optional[Tuple]:
+        """Build a read cache key, or None if the call cannot be cached"""
+        if block_number is None:
+            return None
+        
+        key = (function_name, tuple(sorted(params.items())) if params else (), block_number)
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+    
     def call_read_function(self, function_name: str, params: Dict[str, Any] = None) -> Any:
         """Call a read-only contract function"""
         if not self.contract:
             raise Exception("Contract not initialized")
         
         try:
-            contract_function = getattr(self.contract.functions, function_name)
+            # Pin reads to the cached head so identical calls within a block are cacheable
+            block_number = self._head_block()
+            key = self._read_cache_key(function_name, params, block_number)
+            if key is not None:
+                with self._read_cache_lock:
+                    if key in self._read_cache:
+                        return self._read_cache[key]
             
-            if params:
+            contract_function = self._get_function(function_name)
+            block_identifier = block_number if block_number is not None else 'latest'
+            
+            codec = self._read_codecs.get(function_name)
+            if codec is not None:
+                # Raw eth_call with the precomputed codec
+                call = self._build_eth_call(codec, params, block_identifier)
+                result = self._decode_eth_call(codec, self._batch_rpc([call])[0])
+            elif params:
                 # Convert parameters and call function
-                result = contract_function(**params).call()
+                result = contract_function(**params).call(block_identifier=block_identifier)
             else:
-                result = contract_function().call()
+                result = contract_function().call(block_identifier=block_identifier)
+            
+            logger.info("Read function %s called successfully", function_name)
+            result = self._format_result(result)
+            
+            if key is not None:
+                with self._read_cache_lock:
+                    self._read_cache[key] = result
+            return result
+            
+        except Exception as e:
+            logger.error("Error calling read function %s: %s", function_name, e)
+            raise
+    
+    def _build_eth_call(self, codec: Tuple, params: Optional[Dict[str, Any]],
+                        block_identifier) -> Tuple[str, List[Any]]:
+        """Encode a read call into an eth_call request using a precomputed codec"""
+        data = '0x' + encode_call_data(codec, params).hex()
+        return ('eth_call', [{'to': self._contract_address, 'data': data}, self._block_param(block_identifier)])
+    
+    @staticmethod
+    def _block_param(block_identifier) -> str:
+        """Format a block number or tag as a JSON-RPC block parameter"""
+        return hex(block_identifier) if isinstance(block_identifier, int) else block_identifier
+    
+    def _decode_eth_call(self, codec: Tuple, raw_result: str) -> Any:
+        """Decode raw eth_call output the way web3's contract call would"""
+        return decode_return_data(codec, bytes.fromhex(raw_result[2:]))
+    
+    def call_read_functions_batch(self, calls: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Call several read-only functions in one eth_call through Multicall3's aggregate3
+        
+        Every call is evaluated against the same block. A failing call is reported
+        in its own entry and does not affect the others.
+        """
+        if not self.contract:
+            raise Exception("Contract not initialized")
+        
+        try:
+            results = [None] * len(calls)
+            multicall_codecs = []
+            call3s = []
+            
+            for index, call in enumerate(calls):
+                if not isinstance(call, dict):
+                    results[index] = {'success': False, 'message': 'Each call must be an object'}
+                    continue
+                
+                function_name = call.get('function_name')
+                codec = self._read_codecs.get(function_name)
+                if codec is None:
+                    results[index] = {
+                        'success': False,
+                        'message': f"Function '{function_name}' is not a batchable read function"
+                    }
+                    continue
+                
+                try:
+                    call_data = encode_call_data(codec, call.get('params'))
+                except Exception as e:
+                    results[index] = {'success': False, 'message': str(e)}
+                    continue
+                
+                multicall_codecs.append((index, codec))
+                call3s.append((self._contract_address, True, call_data))
             
-            logger.info(f"Read function {function_name} called successfully")
-            return self._format_result(result)
+            if call3s:
+                block_number = self._head_block()
+                block_identifier = block_number if block_number is not None else 'latest'
+                data = '0x' + (
+                    MULTICALL3_AGGREGATE3_SELECTOR + abi_encode(['(address,bool,bytes)[]'], [call3s])
+                ).hex()
+                raw_result = self._batch_rpc([(
+                    'eth_call',
+                    [{'to': self._multicall3_address, 'data': data}, self._block_param(block_identifier)]
+                )])[0]
+                (returns,) = abi_decode(['(bool,bytes)[]'], bytes.fromhex(raw_result[2:]))
+                
+                for (index, codec), (success, return_data) in zip(multicall_codecs, returns):
+                    if not success:
+                        results[index] = {'success': False, 'message': 'Call reverted'}
+                        continue
+                    try:
+                        result = decode_return_data(codec, return_data)
+                        results[index] = {'success': True, 'result': self._format_result(result)}
+                    except Exception as e:
+                        results[index] = {'success': False, 'message': str(e)}
+            
+            logger.info("Batched %s read calls", len(calls))
+            return results
             
         except Exception as e:
-            logger.error(f"Error calling read function {function_name}: {str(e)}")
+            logger.error("Error calling batched read functions: %s", e)
             raise
     
     def call_write_function(self, function_name: str, params: Dict[str, Any], 
@@ -95,61 +430,175 @@ class ContractHandler:
         if not self.contract:
             raise Exception("Contract not initialized")
         
+        nonce_key = account_address.lower()
+        reserved_nonce = None
         try:
-            contract_function = getattr(self.contract.functions, function_name)
+            contract_function = self._get_function(function_name)
             
-            # Build transaction
+            # Build transaction and encode its calldata once for both estimate and send
             if params:
                 transaction = contract_function(**params)
             else:
                 transaction = contract_function()
+            data = transaction._encode_transaction_data()
+            
+            # A server-side signer is the only sender for its account (gunicorn
+            # runs one worker when PRIVATE_KEY is set), so its next nonce can be
+            # tracked locally instead of fetched per write
+            nonce = None
+            if self.config.PRIVATE_KEY:
+                with self._nonce_lock:
+                    nonce = self._nonces.get(nonce_key)
+                    if nonce is not None:
+                        reserved_nonce = self._reserve_nonce(nonce_key, nonce)
+            
+            # Fetch whatever is still unknown in a single round-trip
+            calls = []
+            if not gas_limit:
+                calls.append(('eth_estimateGas', [{
+                    'from': account_address,
+                    'to': self._contract_address,
+                    'data': data
+                }]))
+            if nonce is None:
+                calls.append(('eth_getTransactionCount', [account_address, 'pending']))
+            if self._chain_id is None:
+                calls.append(('eth_chainId', []))
+            results = iter(self._batch_rpc(calls) if calls else [])
             
-            # Estimate gas if not provided
             if not gas_limit:
-                gas_limit = transaction.estimate_gas({'from': account_address})
-                gas_limit = int(gas_limit * 1.2)  # Add 20% buffer
+                gas_limit = int(int(next(results), 16) * 1.2)  # Add 20% buffer
+            if nonce is None:
+                nonce = int(next(results), 16)
+                if self.config.PRIVATE_KEY:
+                    with self._nonce_lock:
+                        # Another write may have reserved nonces while this one was fetching
+                        nonce = max(nonce, self._nonces.get(nonce_key, nonce))
+                        reserved_nonce = self._reserve_nonce(nonce_key, nonce)
+            if self._chain_id is None:
+                self._chain_id = int(next(results), 16)
             
-            # Build transaction dict
-            tx_dict = transaction.build_transaction({
+            # Build transaction dict; every field build_transaction would fill is already known
+            tx_dict = {
+                'value': 0,
                 'from': account_address,
                 'gas': gas_limit,
-                'gasPrice': self.web3.to_wei(self.config.MAX_GAS_PRICE, 'gwei'),
-                'nonce': self.web3.eth.get_transaction_count(account_address)
-            })
+                'gasPrice': self._max_gas_price_wei,
+                'nonce': nonce,
+                'chainId': self._chain_id,
+                'to': self._contract_address,
+                'data': data
+            }
             
             # For server-side signing (if private key is available)
             if self.config.PRIVATE_KEY:
                 signed_txn = self.web3.eth.account.sign_transaction(
                     tx_dict, private_key=self.config.PRIVATE_KEY
                 )
-                tx_hash = self.web3.eth.send_raw_transaction(signed_txn.rawTransaction)
-                return tx_hash.hex()
+                
+                # The hash is known locally, so broadcast in the background and return now
+                tx_hash = signed_txn.hash.hex()
+                future = _submit_executor.submit(
+                    self.web3.eth.send_raw_transaction, signed_txn.rawTransaction
+                )
+                with self._submissions_lock:
+                    self._submissions[tx_hash.lower()] = future
+                # The broadcast callback now owns the reserved nonce
+                reserved_nonce = None
+                future.add_done_callback(
+                    functools.partial(self._on_transaction_submitted, tx_hash, nonce_key, nonce)
+                )
+                return tx_hash
             else:
                 # Return transaction dict for frontend signing
                 return tx_dict
                 
         except Exception as e:
-            logger.error(f"Error calling write function {function_name}: {str(e)}")
+            if reserved_nonce is not None:
+                self._release_nonce(nonce_key, reserved_nonce, e)
+            logger.error("Error calling write function %s: %s", function_name, e)
             raise
     
+    def _reserve_nonce(self, nonce_key: str, nonce: int) -> int:
+        """Hand out a nonce and advance the cached one; caller holds _nonce_lock"""
+        self._nonces[nonce_key] = nonce + 1
+        self._nonces_in_flight.setdefault(nonce_key, set()).add(nonce)
+        return nonce
+    
+    def _release_nonce(self, nonce_key: str, nonce: int, error: Optional[BaseException]):
+        """Settle a reserved nonce once its transaction was broadcast or abandoned"""
+        with self._nonce_lock:
+            in_flight = self._nonces_in_flight.get(nonce_key, set())
+            in_flight.discard(nonce)
+            
+            if error is not None:
+                if self._nonces.get(nonce_key) == nonce + 1 and 'nonce' not in str(error).lower():
+                    # No later nonce was handed out, so the next write can reuse this one
+                    self._nonces[nonce_key] = nonce
+                else:
+                    # Later nonces are still queued; keep them and resync once they settle
+                    self._nonce_resync.add(nonce_key)
+            
+            if not in_flight:
+                self._nonces_in_flight.pop(nonce_key, None)
+                if nonce_key in self._nonce_resync:
+                    self._nonce_resync.discard(nonce_key)
+                    self._nonces.pop(nonce_key, None)
+    
+    def _on_transaction_submitted(self, tx_hash: str, nonce_key: str, nonce: int, future: Future):
+        """Handle the outcome of a background transaction broadcast"""
+        error = future.exception()
+        self._release_nonce(nonce_key, nonce, error)
+        if error is not None:
+            logger.error("Error submitting transaction %s: %s", tx_hash, error)
+            return
+        
+        # State may have changed; drop cached reads
+        with self._read_cache_lock:
+            self._read_cache.clear()
+    
+    def _submission_status(self, tx_hash: str) -> Optional[Dict[str, Any]]:
+        """Status of a transaction still being (or unsuccessfully) broadcast, if any
+        
+        Broadcast futures live in this process only; gunicorn.conf.py runs a
+        single worker when PRIVATE_KEY is set so every status poll can see them.
+        """
+        with self._submissions_lock:
+            future = self._submissions.get(tx_hash.lower())
+        
+        if future is None or (future.done() and future.exception() is None):
+            return None
+        
+        status = {
+            'status': 'pending',
+            'transaction_hash': tx_hash,
+            'block_number': None,
+            'gas_used': None,
+            'confirmations': 0
+        }
+        if future.done():
+            status.update({'status': 'failed', 'error': str(future.exception())})
+        return status
+    
     def get_transaction_status(self, tx_hash: str) -> Dict[str, Any]:
         """Get transaction status and receipt"""
+        submission_status = self._submission_status(tx_hash)
+        if submission_status is not None:
+            return submission_status
+        
         try:
-            # Get transaction
-            tx = self.web3.eth.get_transaction(tx_hash)
+            # A fresh cached head avoids a second RPC; otherwise batch it with the receipt
+            current_block = self._head_block()
+            calls = [('eth_getTransactionReceipt', [tx_hash])]
+            if current_block is None:
+                calls.append(('eth_blockNumber', []))
             
-            # Try to get receipt
-            try:
-                receipt = self.web3.eth.get_transaction_receipt(tx_hash)
-                status = "success" if receipt.status == 1 else "failed"
-                return {
-                    'status': status,
-                    'block_number': receipt.blockNumber,
-                    'gas_used': receipt.gasUsed,
-                    'transaction_hash': tx_hash,
-                    'confirmations': self.web3.eth.block_number - receipt.blockNumber
-                }
-            except:
+            results = self._batch_rpc(calls)
+            receipt = results[0]
+            if current_block is None:
+                current_block = int(results[1], 16)
+            
+            if receipt is None:
                 # Transaction is pending
                 return {
                     'status': 'pending',
@@ -158,9 +607,19 @@ class ContractHandler:
                     'gas_used': None,
                     'confirmations': 0
                 }
+            
+            block_number = int(receipt['blockNumber'], 16)
+            status = "success" if int(receipt['status'], 16) == 1 else "failed"
+            return {
+                'status': status,
+                'block_number': block_number,
+                'gas_used': int(receipt['gasUsed'], 16),
+                'transaction_hash': tx_hash,
+                'confirmations': max(current_block - block_number, 0)
+            }
                 
         except Exception as e:
-            logger.error(f"Error getting transaction status: {str(e)}")
+            logger.error("Error getting transaction status: %s", e)
             raise
     
     def get_contract_events(self, from_block: str = 'latest', to_block: str = 'latest') -> List[Dict]:
@@ -169,50 +628,247 @@ class ContractHandler:
             raise Exception("Contract not initialized")
         
         try:
-            # Get all events for the contract
-            events = []
+            return list(self.iter_contract_events(from_block, to_block))
+        except Exception:
+            # Already logged where it was raised
+            return []
+    
+    def iter_contract_events(self, from_block: str = 'latest', to_block: str = 'latest') -> Iterator[Dict]:
+        """Return an iterator that decodes contract events one at a time
+        
+        Block arguments are validated and eth_getLogs is called before this
+        returns, so those errors reach the caller instead of cutting a stream
+        short. The raw logs stay in memory while iterating, and an uncached
+        range is also collected for the range cache.
+        """
+        if not self.contract:
+            raise Exception("Contract not initialized")
+        
+        try:
+            from_number = self._parse_block_argument(from_block)
+            to_number = self._parse_block_argument(to_block)
             
-            if from_block == 'latest':
-                from_block = self.web3.eth.block_number - 100  # Last 100 blocks
+            current_block = self._head_block()
+            if current_block is None:
+                current_block = self.web3.eth.block_number
             
-            if to_block == 'latest':
-                to_block = self.web3.eth.block_number
+            if from_number is None:
+                return iter(self._get_recent_events(current_block))
             
-            # Get events (this is a general approach - you might want to filter specific events)
-            event_filter = self.contract.events.getAllEvents.create_filter(
-                fromBlock=from_block,
-                toBlock=to_block
-            )
+            if to_number is None:
+                to_number = current_block
             
-            for event in event_filter.get_all_entries():
-                events.append({
-                    'event': event.event,
-                    'args': dict(event.args),
-                    'transaction_hash': event.transactionHash.hex(),
-                    'block_number': event.blockNumber,
-                    'log_index': event.logIndex
-                })
+            key = (from_number, to_number)
+            with self._events_lock:
+                events = self._events_cache.get(key)
+            if events is not None:
+                return iter(events)
             
-            return events
+            return self._decode_and_cache_events(key, self._get_logs(from_number, to_number))
             
         except Exception as e:
-            logger.error(f"Error getting contract events: {str(e)}")
-            return []
+            logger.error("Error getting contract events: %s", e)
+            raise
+    
+    @staticmethod
+    def _parse_block_argument(block: str) -> Optional[int]:
+        """Parse a from/to block argument; None stands for 'latest'"""
+        if block == 'latest':
+            return None
+        try:
+            number = int(block)
+        except (TypeError, ValueError):
+            raise ValueError(f"Invalid block number: {block}") from None
+        if number < 0:
+            raise ValueError(f"Invalid block number: {block}")
+        return number
+    
+    def _decode_and_cache_events(self, key: Tuple[int, int], logs: List[Any]) -> Iterator[Dict]:
+        """Decode logs lazily and cache the range once all of them are decoded"""
+        events = []
+        try:
+            for event in self._decode_logs(logs):
+                events.append(event)
+                yield event
+        except Exception as e:
+            logger.error("Error decoding contract events: %s", e)
+            raise
+        
+        with self._events_lock:
+            self._events_cache[key] = events
+    
+    def _get_recent_events(self, current_block: int) -> List[Dict]:
+        """Serve events from the last 100 blocks, fetching only blocks not seen yet"""
+        window_start = current_block - 100
+        
+        with self._events_lock:
+            last_seen_block = self._last_seen_block
+            
+            # The log subscription keeps the buffer current; serve it without any RPC
+            if self._log_subscription_active or last_seen_block == current_block:
+                return [e for e in self._recent_events if e['block_number'] >= window_start]
+        
+        # Re-fetch a short tail of already-seen blocks so reorged events get replaced
+        if last_seen_block is None or last_seen_block < window_start:
+            fetch_from = window_start
+        else:
+            fetch_from = max(last_seen_block + 1 - REORG_TAIL_BLOCKS, window_start)
+        fetched = list(self._decode_logs(self._get_logs(fetch_from, current_block)))
+        
+        with self._events_lock:
+            # Another request may have refreshed to a newer head while we fetched
+            if self._last_seen_block is None or self._last_seen_block < current_block:
+                kept = [e for e in self._recent_events if window_start <= e['block_number'] < fetch_from]
+                self._recent_events = deque(kept + fetched, maxlen=self.config.EVENT_BUFFER_SIZE)
+                self._last_seen_block = current_block
+            
+            return [e for e in self._recent_events if e['block_number'] >= window_start]
+    
+    def _get_logs(self, from_block: int, to_block: int) -> List[Any]:
+        """Fetch all contract logs in a block range with one eth_getLogs call"""
+        return self.web3.eth.get_logs({
+            'address': self.contract.address,
+            'fromBlock': from_block,
+            'toBlock': to_block
+        })
+    
+    def _decode_logs(self, logs: List[Any]) -> Iterator[Dict]:
+        """Decode raw logs lazily, skipping ones that are not known events"""
+        for log in logs:
+            event = self._decode_log(log)
+            if event is not None:
+                yield event
+    
+    def _decode_log(self, log) -> Optional[Dict]:
+        """Decode a raw log into an event dict, or None if it is not a known event"""
+        if not log['topics']:
+            return None
+        
+        decoder = self._event_decoders.get(bytes(log['topics'][0]))
+        if decoder is None:
+            return None
+        
+        event = decoder.process_log(log)
+        return {
+            'event': event.event,
+            'args': self._format_result(dict(event.args)),
+            'transaction_hash': event.transactionHash.hex(),
+            'block_number': event.blockNumber,
+            'log_index': event.logIndex
+        }
+    
+    async def _subscribe_logs(self):
+        """Feed the recent-events buffer from an eth_subscribe logs stream"""
+        while True:
+            try:
+                provider = WebsocketProviderV2(self.config.RPC_URL)
+                async with AsyncWeb3.persistent_websocket(provider) as w3:
+                    await w3.eth.subscribe('logs', {'address': self._contract_address})
+                    
+                    # Backfill the window once; later logs arrive through the subscription
+                    current_block = await w3.eth.block_number
+                    logs = await w3.eth.get_logs({
+                        'address': self._contract_address,
+                        'fromBlock': max(current_block - 100, 0),
+                        'toBlock': current_block
+                    })
+                    events = [e for e in map(self._decode_log, logs) if e is not None]
+                    with self._events_lock:
+                        self._recent_events = deque(events, maxlen=self.config.EVENT_BUFFER_SIZE)
+                        self._last_seen_block = current_block
+                        self._log_subscription_active = True
+                    
+                    async for message in w3.ws.listen_to_websocket():
+                        log = self._normalize_log(message['result'])
+                        if log.get('removed'):
+                            # Reorged out: drop the event the log produced earlier
+                            self._remove_event(log['transactionHash'].hex(), log['logIndex'])
+                            continue
+                        
+                        event = self._decode_log(log)
+                        if event is not None:
+                            self._add_event(event)
+                            
+            except Exception as e:
+                logger.warning("Log subscription dropped: %s", e)
+            
+            # Fall back to on-demand fetching until the subscription is back
+            with self._events_lock:
+                self._log_subscription_active = False
+            await asyncio.sleep(5)
+    
+    def _add_event(self, event: Dict):
+        """Buffer a pushed event, replacing any copy of the same log already held
+        
+        Logs are matched by (transaction_hash, log_index) rather than by block,
+        so pushes that overlap the backfill are deduplicated while logs
+        re-included after a reorg are still added.
+        """
+        key = (event['transaction_hash'], event['log_index'])
+        with self._events_lock:
+            for index, existing in enumerate(self._recent_events):
+                if (existing['transaction_hash'], existing['log_index']) == key:
+                    self._recent_events[index] = event
+                    break
+            else:
+                self._recent_events.append(event)
+            self._last_seen_block = max(self._last_seen_block, event['block_number'])
+    
+    def _remove_event(self, transaction_hash: str, log_index: int):
+        """Drop a buffered event whose log was removed by a reorg"""
+        with self._events_lock:
+            self._recent_events = deque(
+                (e for e in self._recent_events
+                 if (e['transaction_hash'], e['log_index']) != (transaction_hash, log_index)),
+                maxlen=self.config.EVENT_BUFFER_SIZE
+            )
+    
+    @staticmethod
+    def _normalize_log(log) -> Dict[str, Any]:
+        """Coerce a subscription log payload into the shape eth_getLogs returns"""
+        def to_int(value):
+            return int(value, 16) if isinstance(value, str) else value
+        
+        return {
+            **log,
+            'topics': [HexBytes(topic) for topic in log['topics']],
+            'data': HexBytes(log['data']),
+            'transactionHash': HexBytes(log['transactionHash']),
+            'blockHash': HexBytes(log['blockHash']),
+            'blockNumber': to_int(log['blockNumber']),
+            'logIndex': to_int(log['logIndex']),
+            'transactionIndex': to_int(log['transactionIndex'])
+        }
     
     def get_network_info(self) -> Dict[str, Any]:
         """Get current network information"""
+        network_info = {
+            'network': self.config.BLOCKCHAIN_NETWORK,
+            'chain_id': None,
+            'block_number': None,
+            'gas_price': None,
+            'is_connected': False,
+            'contract_address': self.config.CONTRACT_ADDRESS
+        }
+        
         try:
-            return {
-                'network': self.config.BLOCKCHAIN_NETWORK,
-                'chain_id': self.web3.eth.chain_id,
-                'block_number': self.web3.eth.block_number,
-                'gas_price': self.web3.eth.gas_price,
-                'is_connected': self.web3.is_connected(),
-                'contract_address': self.config.CONTRACT_ADDRESS
-            }
+            # Fetch all chain scalars in a single round-trip
+            chain_id, block_number, gas_price = self._batch_rpc([
+                ('eth_chainId', []),
+                ('eth_blockNumber', []),
+                ('eth_gasPrice', [])
+            ])
         except Exception as e:
-            logger.error(f"Error getting network info: {str(e)}")
-            raise
+            logger.error("Error getting network info: %s", e)
+            return network_info
+        
+        network_info.update({
+            'chain_id': int(chain_id, 16),
+            'block_number': int(block_number, 16),
+            'gas_price': int(gas_price, 16),
+            'is_connected': True
+        })
+        return network_info
     
     def get_account_balance(self, account_address: str) -> Dict[str, Any]:
         """Get account ETH balance"""
@@ -227,7 +883,7 @@ class ContractHandler:
                 'balance_formatted': f"{balance_eth:.4f} ETH"
             }
         except Exception as e:
-            logger.error(f"Error getting account balance: {str(e)}")
+            logger.error("Error getting account balance: %s", e)
             raise
     
     def estimate_gas(self, function_name: str, params: Dict[str, Any], 
@@ -237,7 +893,7 @@ class ContractHandler:
             raise Exception("Contract not initialized")
         
         try:
-            contract_function = getattr(self.contract.functions, function_name)
+            contract_function = self._get_function(function_name)
             
             if params:
                 gas_estimate = contract_function(**params).estimate_gas({'from': account_address})
@@ -247,24 +903,75 @@ class ContractHandler:
             return gas_estimate
             
         except Exception as e:
-            logger.error(f"Error estimating gas: {str(e)}")
+            logger.error("Error estimating gas: %s", e)
             raise
     
+    def _batch_rpc(self, calls: List[Tuple[str, List[Any]]]) -> List[Any]:
+        """Send several JSON-RPC calls as one batch and return their raw results in order"""
+        if not isinstance(self.web3.provider, Web3.HTTPProvider):
+            # IPC/WebSocket calls are cheap on a persistent socket; send them in turn
+            replies = [self.web3.provider.make_request(method, params) for method, params in calls]
+            return self._unpack_rpc_replies(calls, replies)
+        
+        payload = [
+            {'jsonrpc': '2.0', 'id': request_id, 'method': method, 'params': params}
+            for request_id, (method, params) in enumerate(calls)
+        ]
+        response = self.session.post(self.config.RPC_URL, json=payload, timeout=10)
+        response.raise_for_status()
+        
+        replies = response.json()
+        if not isinstance(replies, list) or len(replies) != len(calls):
+            raise Exception(f"Unexpected JSON-RPC batch response: {replies}")
+        
+        replies = sorted(replies, key=lambda reply: reply['id'])
+        return self._unpack_rpc_replies(calls, replies)
+    
+    def _unpack_rpc_replies(self, calls: List[Tuple[str, List[Any]]],
+                            replies: List[Dict[str, Any]]) -> List[Any]:
+        """Extract results from JSON-RPC replies, raising on the first error"""
+        results = []
+        for (method, _), reply in zip(calls, replies):
+            if 'error' in reply:
+                raise Exception(f"{method} failed: {reply['error'].get('message')}")
+            results.append(reply.get('result'))
+        return results
+    
     def _format_result(self, result) -> Any:
         """Format contract call result for JSON serialization"""
-        if isinstance(result, (list, tuple)):
+        # Exact type checks first: they cover almost every ABI value and skip MRO walks
+        result_type = type(result)
+        if result_type is int:
+            # uint256 values would lose precision (or fail to serialize) as JSON numbers
+            return result if -MAX_SAFE_INTEGER <= result <= MAX_SAFE_INTEGER else str(result)
+        if result_type is str or result_type is bool:
+            return result
+        if result_type is list or result_type is tuple:
+            return [self._format_result(item) for item in result]
+        if result_type is dict:
+            return {k: self._format_result(v) for k, v in result.items()}
+        if result_type is bytes:
+            return result.hex()
+        
+        # Less common shapes: HexBytes, named tuples, AttributeDicts
+        if isinstance(result, bytes):
+            return result.hex()
+        elif hasattr(result, '_fields'):
+            return {k: self._format_result(v) for k, v in result._asdict().items()}
+        elif isinstance(result, (list, tuple)):
             return [self._format_result(item) for item in result]
         elif hasattr(result, '__dict__'):
             return {k: self._format_result(v) for k, v in result.__dict__.items()}
-        elif isinstance(result, bytes):
-            return result.hex()
         else:
             return result
     
     def is_valid_address(self, address: str) -> bool:
         """Check if address is a valid Ethereum address"""
-        try:
-            Web3.to_checksum_address(address)
-            return True
-        except:
+        if not isinstance(address, str) or not _ADDRESS_RE.fullmatch(address):
             return False
+        
+        # Single-case addresses carry no checksum; only mixed case needs a keccak
+        body = address[2:]
+        if body == body.lower() or body == body.upper():
+            return True
+        return to_checksum_address(address) == address
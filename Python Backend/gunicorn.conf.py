@@ -0,0 +1,27 @@
+"""Gunicorn settings: gevent workers so blocking Web3 RPC calls multiplex cooperatively
+
+Run with: gunicorn -c gunicorn.conf.py app:app
+"""
+import multiprocessing
+import os
+from dotenv import load_dotenv
+
+# Read .env here too, so PRIVATE_KEY set there is seen when sizing workers
+load_dotenv()
+
+# Make app.py monkey-patch too, in case the app is preloaded in the master
+os.environ.setdefault('GEVENT_PATCH', 'true')
+
+# Gunicorn is the production entry point: keep per-request logging off the hot path
+os.environ.setdefault('LOG_LEVEL', 'WARNING')
+
+bind = f"{os.environ.get('FLASK_HOST', '127.0.0.1')}:{os.environ.get('FLASK_PORT', 5000)}"
+
+# Server-side signing tracks the account's nonces and broadcast outcomes in
+# process memory, so the signing process must be the account's only sender
+if os.environ.get('PRIVATE_KEY'):
+    workers = 1
+else:
+    workers = int(os.environ.get('GUNICORN_WORKERS', multiprocessing.cpu_count()))
+worker_class = 'gevent'
+worker_connections = 1000
@@ -0,0 +1,101 @@
+import pytest
+from eth_abi import encode as abi_encode
+from web3 import Web3
+from web3.providers.base import BaseProvider
+
+from abi_codec import build_read_codecs, coerce_arg, decode_return_data, encode_call_data
+
+CONTRACT_ADDRESS = '0x' + '11' * 20
+OWNER = '0x52908400098527886e0f7030069857d2e4169ee7'
+RECIPIENTS = ['0xde709f2102306220921060314715629080e2fb77', '0x' + 'ab' * 20]
+
+TEST_ABI = [
+    {'type': 'function', 'name': 'totalSupply', 'stateMutability': 'view',
+     'inputs': [], 'outputs': [{'name': '', 'type': 'uint256'}]},
+    {'type': 'function', 'name': 'ownerOf', 'stateMutability': 'view',
+     'inputs': [{'name': 'tokenId', 'type': 'uint256'}],
+     'outputs': [{'name': '', 'type': 'address'}]},
+    {'type': 'function', 'name': 'recipients', 'stateMutability': 'view',
+     'inputs': [{'name': 'tokenId', 'type': 'uint256'}, {'name': 'active', 'type': 'bool'}],
+     'outputs': [{'name': '', 'type': 'address[]'}]},
+    {'type': 'function', 'name': 'royaltyInfo', 'stateMutability': 'view',
+     'inputs': [{'name': 'tokenId', 'type': 'uint256'}, {'name': 'salePrice', 'type': 'uint256'}],
+     'outputs': [{'name': 'receiver', 'type': 'address'}, {'name': 'amount', 'type': 'uint256'}]},
+    {'type': 'function', 'name': 'split', 'stateMutability': 'view',
+     'inputs': [{'name': 'tokenId', 'type': 'uint256'}],
+     'outputs': [{'name': '', 'type': 'tuple', 'components': [
+         {'name': 'owner', 'type': 'address'},
+         {'name': 'shares', 'type': 'uint16[]'},
+         {'name': 'payees', 'type': 'address[]'},
+     ]}]},
+    {'type': 'function', 'name': 'setRoyalty', 'stateMutability': 'nonpayable',
+     'inputs': [{'name': 'bps', 'type': 'uint96'}], 'outputs': []},
+]
+
+class CannedCallProvider(BaseProvider):
+    """Answer every eth_call with fixed return data"""
+
+    def __init__(self, return_data: bytes):
+        self.return_data = return_data
+        self.calls = []
+
+    def make_request(self, method, params):
+        self.calls.append((method, params))
+        if method == 'eth_chainId':
+            return {'jsonrpc': '2.0', 'id': 1, 'result': '0x1'}
+        return {'jsonrpc': '2.0', 'id': 1, 'result': '0x' + self.return_data.hex()}
+
+    def is_connected(self, show_traceback=False):
+        return True
+
+CODECS = build_read_codecs(TEST_ABI)
+
+def web3_call(function_name, return_data, *args):
+    """Decode return data through web3's own contract call path"""
+    w3 = Web3(CannedCallProvider(return_data))
+    contract = w3.eth.contract(address=Web3.to_checksum_address(CONTRACT_ADDRESS), abi=TEST_ABI)
+    return getattr(contract.functions, function_name)(*args).call()
+
+@pytest.mark.parametrize('function_name, output_types, values, args', [
+    ('totalSupply', ['uint256'], [12345], []),
+    ('ownerOf', ['address'], [OWNER], [1]),
+    ('recipients', ['address[]'], [RECIPIENTS], [1, True]),
+    ('royaltyInfo', ['address', 'uint256'], [OWNER, 250], [1, 10000]),
+    ('split', ['(address,uint16[],address[])'], [(OWNER, [7000, 3000], RECIPIENTS)], [1]),
+])
+def test_decode_matches_web3_call(function_name, output_types, values, args):
+    return_data = abi_encode(output_types, values)
+
+    assert decode_return_data(CODECS[function_name], return_data) == \
+        web3_call(function_name, return_data, *args)
+
+def test_encode_matches_web3_calldata():
+    w3 = Web3(CannedCallProvider(b''))
+    contract = w3.eth.contract(address=Web3.to_checksum_address(CONTRACT_ADDRESS), abi=TEST_ABI)
+
+    expected = contract.encodeABI(fn_name='recipients', args=[10, False])
+    data = encode_call_data(CODECS['recipients'], {'tokenId': '010', 'active': 'false'})
+
+    assert '0x' + data.hex() == expected
+
+def test_write_functions_have_no_read_codec():
+    assert 'setRoyalty' not in CODECS
+
+def test_coerce_int_only_treats_0x_as_hex():
+    assert coerce_arg('uint256', '010') == 10
+    assert coerce_arg('uint256', '0x10') == 16
+    assert coerce_arg('int256', '-5') == -5
+    with pytest.raises(ValueError):
+        coerce_arg('uint256', 'ten')
+
+def test_coerce_bool_rejects_unknown_strings():
+    assert coerce_arg('bool', 'TRUE') is True
+    assert coerce_arg('bool', '0') is False
+    with pytest.raises(ValueError):
+        coerce_arg('bool', 'yes')
+
+def test_encode_rejects_missing_and_unexpected_params():
+    with pytest.raises(Exception, match='Missing parameters: salePrice'):
+        encode_call_data(CODECS['royaltyInfo'], {'tokenId': '1'})
+    with pytest.raises(Exception, match='Unexpected parameters: tokenid'):
+        encode_call_data(CODECS['ownerOf'], {'tokenId': '1', 'tokenid': '2'})
@@ -0,0 +1,184 @@
+import os
+import threading
+from collections import deque
+from types import SimpleNamespace
+
+import pytest
+import rlp
+from cachetools import TTLCache
+from eth_account import Account
+from web3 import Web3
+from web3.providers.base import BaseProvider
+
+# ProductionConfig insists on RPC_URL when config is imported
+os.environ.setdefault('RPC_URL', 'http://127.0.0.1:8545')
+
+from contract_handler import REORG_TAIL_BLOCKS, ContractHandler
+
+CONTRACT_ADDRESS = Web3.to_checksum_address('0x' + '11' * 20)
+
+WRITE_ABI = [
+    {'type': 'function', 'name': 'setRoyalty', 'stateMutability': 'nonpayable',
+     'inputs': [{'name': 'bps', 'type': 'uint96'}], 'outputs': []},
+]
+
+class AcceptAllProvider(BaseProvider):
+    """Accept every request, answering with a zero hash"""
+
+    def __init__(self):
+        self.raw_transactions = []
+
+    def make_request(self, method, params):
+        if method == 'eth_sendRawTransaction':
+            self.raw_transactions.append(bytes.fromhex(params[0][2:]))
+        return {'jsonrpc': '2.0', 'id': 1, 'result': '0x' + '00' * 32}
+
+    def is_connected(self, show_traceback=False):
+        return True
+
+@pytest.fixture
+def handler():
+    """ContractHandler with in-memory state only; never connects to a node"""
+    handler = object.__new__(ContractHandler)
+    handler._nonces = {}
+    handler._nonces_in_flight = {}
+    handler._nonce_resync = set()
+    handler._nonce_lock = threading.Lock()
+    return handler
+
+def reserve(handler, key, *nonces):
+    with handler._nonce_lock:
+        for nonce in nonces:
+            handler._reserve_nonce(key, nonce)
+
+def test_failed_nonce_rolls_back_when_no_later_nonce_was_handed_out(handler):
+    reserve(handler, 'a', 5, 6)
+
+    handler._release_nonce('a', 6, RuntimeError('insufficient funds'))
+
+    assert handler._nonces['a'] == 6
+    assert handler._nonces_in_flight['a'] == {5}
+
+def test_failed_nonce_resyncs_once_later_nonces_settle(handler):
+    reserve(handler, 'a', 5, 6, 7)
+
+    handler._release_nonce('a', 5, RuntimeError('insufficient funds'))
+    assert handler._nonces['a'] == 8
+
+    handler._release_nonce('a', 6, None)
+    assert handler._nonces['a'] == 8
+
+    handler._release_nonce('a', 7, None)
+    assert 'a' not in handler._nonces
+    assert 'a' not in handler._nonces_in_flight
+    assert 'a' not in handler._nonce_resync
+
+def test_nonce_error_refetches_instead_of_rolling_back(handler):
+    reserve(handler, 'a', 5)
+
+    handler._release_nonce('a', 5, ValueError('nonce too low'))
+
+    assert 'a' not in handler._nonces
+    assert 'a' not in handler._nonces_in_flight
+
+def test_fetched_nonce_never_goes_below_a_concurrent_reservation(handler):
+    account = Account.create()
+    key = account.address.lower()
+    handler.config = SimpleNamespace(PRIVATE_KEY=account.key.hex())
+    provider = AcceptAllProvider()
+    handler.web3 = Web3(provider)
+    handler.contract = handler.web3.eth.contract(address=CONTRACT_ADDRESS, abi=WRITE_ABI)
+    handler._fn_cache = {'setRoyalty': handler.contract.functions.setRoyalty}
+    handler._contract_address = CONTRACT_ADDRESS
+    handler._max_gas_price_wei = Web3.to_wei(1, 'gwei')
+    handler._chain_id = 1
+    handler._submissions = TTLCache(maxsize=16, ttl=60)
+    handler._submissions_lock = threading.Lock()
+    handler._read_cache = {}
+    handler._read_cache_lock = threading.Lock()
+
+    def batch_rpc(calls):
+        # Another write reserves nonce 7 while this one waits for 'pending'
+        reserve(handler, key, 7)
+        return ['0x7']
+    handler._batch_rpc = batch_rpc
+
+    tx_hash = handler.call_write_function('setRoyalty', {'bps': 5}, account.address, gas_limit=100000)
+    handler._submissions[tx_hash.lower()].result(timeout=5)
+
+    (raw_transaction,) = provider.raw_transactions
+    assert int.from_bytes(rlp.decode(raw_transaction)[0], 'big') == 8
+    assert handler._nonces[key] == 9
+
+def event(block_number, transaction_hash):
+    return {'block_number': block_number, 'transaction_hash': transaction_hash, 'log_index': 0}
+
+@pytest.fixture
+def events_handler():
+    """Handler whose eth_getLogs answers from a per-test chain of events"""
+    handler = object.__new__(ContractHandler)
+    handler.config = SimpleNamespace(EVENT_BUFFER_SIZE=100)
+    handler._events_lock = threading.Lock()
+    handler._recent_events = deque(maxlen=100)
+    handler._last_seen_block = None
+    handler._log_subscription_active = False
+    handler.chain = []
+    handler.fetched_ranges = []
+
+    def get_logs(from_block, to_block):
+        handler.fetched_ranges.append((from_block, to_block))
+        return [e for e in handler.chain if from_block <= e['block_number'] <= to_block]
+    handler._get_logs = get_logs
+    handler._decode_logs = iter
+    return handler
+
+def test_recent_events_refetch_reorg_tail_and_replace_stale_events(events_handler):
+    events_handler.chain = [event(150, 'a'), event(198, 'b')]
+    assert events_handler._get_recent_events(200) == [event(150, 'a'), event(198, 'b')]
+
+    # Block 198 is reorged: 'b' moves to block 199 and a new event lands in 201
+    events_handler.chain = [event(150, 'a'), event(199, 'b'), event(201, 'c')]
+    events = events_handler._get_recent_events(202)
+
+    assert events == [event(150, 'a'), event(199, 'b'), event(201, 'c')]
+    assert events_handler.fetched_ranges == [(100, 200), (201 - REORG_TAIL_BLOCKS, 202)]
+
+def test_recent_events_skip_rpc_when_head_is_unchanged(events_handler):
+    events_handler.chain = [event(150, 'a')]
+    events_handler._get_recent_events(200)
+
+    assert events_handler._get_recent_events(200) == [event(150, 'a')]
+    assert events_handler.fetched_ranges == [(100, 200)]
+
+def test_recent_events_keep_a_newer_refresh(events_handler):
+    events_handler.chain = [event(205, 'new')]
+    events_handler._get_recent_events(210)
+
+    # A slower request for an older head must not roll the buffer back
+    events_handler.chain = []
+    assert events_handler._get_recent_events(208) == [event(205, 'new')]
+    assert events_handler._last_seen_block == 210
+
+def test_pushed_events_dedupe_by_log_and_keep_reincluded_logs(events_handler):
+    events_handler.chain = [event(198, 'a'), event(199, 'b')]
+    events_handler._get_recent_events(200)
+
+    # The subscription repeats a backfilled log, then reorgs 'b' back into block 199
+    events_handler._add_event(event(198, 'a'))
+    events_handler._remove_event('b', 0)
+    events_handler._add_event(event(199, 'b'))
+
+    assert list(events_handler._recent_events) == [event(198, 'a'), event(199, 'b')]
+    assert events_handler._last_seen_block == 200
+
+def test_batch_reports_malformed_calls_per_entry():
+    handler = object.__new__(ContractHandler)
+    handler.contract = object()
+    handler._read_codecs = {}
+
+    results = handler.call_read_functions_batch(['totalSupply', {'function_name': 'missing'}])
+
+    assert results == [
+        {'success': False, 'message': 'Each call must be an object'},
+        {'success': False, 'message': "Function 'missing' is not a batchable read function"},
+    ]